@@ -50,6 +50,33 @@ CONF_ON_DISCONNECT = "on_disconnect"
 CONF_ON_BUTTON = "on_button"
 CONF_ON_STICK = "on_stick"
 
+# Trigger config keys and the arguments each trigger passes to its actions
+_TRIGGERS = (
+    (CONF_ON_CONNECT, []),
+    (CONF_ON_DISCONNECT, []),
+    (CONF_ON_BUTTON, [(cg.std_string, "input"), (cg.bool_, "pressed")]),
+    (CONF_ON_STICK, []),
+)
+
+# ESP-IDF sdkconfig options for the gamepad BLE tuning profile
+_SDKCONFIG = (
+    # Enable GATT client in ESP-IDF (esp32_ble's final_validation only sets this
+    # when esp32_ble_tracker/client are loaded, but we're a direct GATT client)
+    ("CONFIG_BT_GATTC_ENABLE", True),
+    ("CONFIG_BT_GATTS_ENABLE", True),  # Required when GATTC is enabled
+    # Gamepad-specific BLE configuration - minimize memory usage
+    ("CONFIG_BT_GATT_MAX_SR_PROFILES", 2),  # Reduced from 8 - only need HID service
+    ("CONFIG_BTDM_CTRL_MODE_BLE_ONLY", True),  # ESP32-S3 BLE-only mode
+    # Reduce Bluedroid memory footprint
+    ("CONFIG_BT_BLE_DYNAMIC_ENV_MEMORY", True),  # Use dynamic memory allocation
+    # Allocate BLE memory from PSRAM first (requires PSRAM-enabled ESP32-S3)
+    # This moves BLE stack allocations out of precious internal RAM
+    ("CONFIG_BT_ALLOCATION_FROM_SPIRAM_FIRST", True),
+    # Keep the Bluedroid host task on core 0, away from ESPHome's loop task
+    # (core 1), which is where esp32_ble dispatches queued events to us
+    ("CONFIG_BT_BLUEDROID_PINNED_TO_CORE_0", True),
+)
+
 # Configuration schema
 CONFIG_SCHEMA = cv.Schema(
     {
@@ -132,45 +159,12 @@ async def to_code(config):
     # Enable GATT client interface (required for GATTcEventHandler to exist)
     cg.add_define("USE_ESP32_BLE_CLIENT")
 
-    # Enable GATT client in ESP-IDF (esp32_ble's final_validation only sets this
-    # when esp32_ble_tracker/client are loaded, but we're a direct GATT client)
-    add_idf_sdkconfig_option("CONFIG_BT_GATTC_ENABLE", True)
-    add_idf_sdkconfig_option(
-        "CONFIG_BT_GATTS_ENABLE", True
-    )  # Required when GATTC is enabled
-
-    # Gamepad-specific BLE configuration - minimize memory usage
-    add_idf_sdkconfig_option(
-        "CONFIG_BT_GATT_MAX_SR_PROFILES", 2
-    )  # Reduced from 8 - only need HID service
-    add_idf_sdkconfig_option(
-        "CONFIG_BTDM_CTRL_MODE_BLE_ONLY", True
-    )  # ESP32-S3 BLE-only mode
-
-    # Reduce Bluedroid memory footprint
-    add_idf_sdkconfig_option(
-        "CONFIG_BT_BLE_DYNAMIC_ENV_MEMORY", True
-    )  # Use dynamic memory allocation
-
-    # Allocate BLE memory from PSRAM first (requires PSRAM-enabled ESP32-S3)
-    # This moves BLE stack allocations out of precious internal RAM
-    add_idf_sdkconfig_option("CONFIG_BT_ALLOCATION_FROM_SPIRAM_FIRST", True)
+    # Apply the gamepad BLE tuning profile
+    for key, value in _SDKCONFIG:
+        add_idf_sdkconfig_option(key, value)
 
     # Register automation triggers
-    for conf in config.get(CONF_ON_CONNECT, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [], conf)
-
-    for conf in config.get(CONF_ON_DISCONNECT, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [], conf)
-
-    for conf in config.get(CONF_ON_BUTTON, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(
-            trigger, [(cg.std_string, "input"), (cg.bool_, "pressed")], conf
-        )
-
-    for conf in config.get(CONF_ON_STICK, []):
-        trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
-        await automation.build_automation(trigger, [], conf)
+    for key, args in _TRIGGERS:
+        for conf in config.get(key, ()):
+            trigger = cg.new_Pvariable(conf[CONF_TRIGGER_ID], var)
+            await automation.build_automation(trigger, args, conf)
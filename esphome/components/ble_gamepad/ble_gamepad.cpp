@@ -949,7 +949,7 @@ void BLEGamepad::gattc_event_handler(esp_gattc_cb_event_t event, esp_gatt_if_t g
   }
 }
 
-void BLEGamepad::handle_notification_(uint8_t *value, uint16_t value_len) {
+BLE_GAMEPAD_HOT_ATTR void BLEGamepad::handle_notification_(uint8_t *value, uint16_t value_len) {
   if (active_controller_ == nullptr) {
     return;
   }
@@ -6,6 +6,14 @@
 #include <cstdint>
 #include <string>
 
+// HID report parsing runs on every BLE notification. Firmware is built with -Os,
+// so the few small functions on that path opt into -O2 individually instead of
+// raising the optimization level for the whole image. Override with
+// -DBLE_GAMEPAD_HOT_ATTR= to build them like everything else.
+#ifndef BLE_GAMEPAD_HOT_ATTR
+#define BLE_GAMEPAD_HOT_ATTR __attribute__((optimize("O2")))
+#endif
+
 namespace esphome::ble_gamepad {
 
 /**
@@ -86,6 +94,9 @@ class ControllerBase {
   /**
    * @brief Parse HID input report and update controller state.
    *
+   * Called for every notification; implementations should mark their
+   * definition (and any helpers it calls) with BLE_GAMEPAD_HOT_ATTR.
+   *
    * @param report Raw HID report data
    * @param len Length of report data
    * @return true if parsing succeeded, false on error
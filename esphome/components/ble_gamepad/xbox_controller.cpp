@@ -39,7 +39,7 @@ void XboxController::on_disconnect() {
   state_.reset();
 }
 
-bool XboxController::parse_input_report(const uint8_t *report, uint16_t len) {
+BLE_GAMEPAD_HOT_ATTR bool XboxController::parse_input_report(const uint8_t *report, uint16_t len) {
   if (report == nullptr || len < 2) {
     ESP_LOGW(TAG, "Invalid report: null or too short");
     return false;
@@ -49,7 +49,7 @@ bool XboxController::parse_input_report(const uint8_t *report, uint16_t len) {
   return parse_ble_report_(report, len);
 }
 
-bool XboxController::parse_ble_report_(const uint8_t *data, uint16_t len) {
+BLE_GAMEPAD_HOT_ATTR bool XboxController::parse_ble_report_(const uint8_t *data, uint16_t len) {
   // Xbox BLE HID input report: 16 bytes (Report ID 0x01 already stripped by BLE stack)
   if (len < 16) {
     ESP_LOGW(TAG, "BLE report too short: %d (expected 16)", len);
@@ -119,7 +119,7 @@ bool XboxController::parse_ble_report_(const uint8_t *data, uint16_t len) {
   return true;
 }
 
-int8_t XboxController::normalize_stick_16_(uint16_t raw) {
+BLE_GAMEPAD_HOT_ATTR int8_t XboxController::normalize_stick_16_(uint16_t raw) {
   // Convert 0-65535 (center=32768) to -127 to 127 (center=0)
   int32_t centered = static_cast<int32_t>(raw) - STICK_CENTER_16;
 
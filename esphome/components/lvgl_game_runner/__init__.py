@@ -68,6 +68,47 @@ INPUT_TYPES = {
     "ROTATE_CCW": InputTypeEnum.ROTATE_CCW,
     "TOUCH": InputTypeEnum.TOUCH,
 }
+# Validators built once and shared by the schemas below
+_FPS_VALIDATOR = cv.float_range(min=1.0, max=240.0)
+_INPUT_TYPE_VALIDATOR = cv.templatable(cv.enum(INPUT_TYPES))
+_PLAYER_VALIDATOR = cv.templatable(cv.int_range(min=1, max=4))
+
+# Schemas for games without options of their own, keyed by C++ class name
+# (MockObjClass overrides __eq__ and is unhashable, so it can't be the key)
+_EMPTY_GAME_SCHEMAS = {}
+
+
+def empty_game_schema(game_class):
+    """Return the shared config schema for a game that only declares an ID."""
+    key = str(game_class)
+    if (schema := _EMPTY_GAME_SCHEMAS.get(key)) is None:
+        schema = _EMPTY_GAME_SCHEMAS[key] = cv.Schema(
+            {
+                cv.GenerateID(): cv.declare_id(game_class),
+            }
+        )
+    return schema
+
+
+def simple_game(namespace, class_name):
+    """Declare a game component that has no options beyond its ID.
+
+    Returns the game's namespace, class, CONFIG_SCHEMA and to_code for the
+    component's __init__.py to bind as module globals.
+    """
+    game_ns = cg.esphome_ns.namespace(namespace)
+    game_class = game_ns.class_(class_name, GameBase)
+
+    async def to_code(config):
+        cg.new_Pvariable(config[CONF_ID])
+
+    return game_ns, game_class, empty_game_schema(game_class), to_code
+
+
+def _fps_to_period_ms(value):
+    """Validate a frame rate and convert it to the frame period in milliseconds."""
+    fps = _FPS_VALIDATOR(value)
+    return round(1000.0 / fps)
 
 
 CONFIG_SCHEMA = cv.Schema(
@@ -75,7 +116,7 @@ CONFIG_SCHEMA = cv.Schema(
         cv.GenerateID(): cv.declare_id(LvglGameRunner),
         cv.Required(CONF_CANVAS): cv.use_id(lvgl.Widget),
         cv.Optional(CONF_INITIAL_GAME): cv.use_id(GameBase),
-        cv.Optional(CONF_FPS, default=30.0): cv.float_range(min=1.0, max=240.0),
+        cv.Optional(CONF_FPS, default=30.0): _fps_to_period_ms,
         cv.Optional(CONF_START_PAUSED, default=False): cv.boolean,
     }
 ).extend(cv.COMPONENT_SCHEMA)
@@ -85,44 +126,52 @@ async def to_code(config):
     var = cg.new_Pvariable(config[CONF_ID])
     await cg.register_component(var, config)
 
-    period_ms = int(round(1000.0 / config[CONF_FPS]))
-    cg.add(var.set_initial_period(period_ms))
+    # CONF_FPS is already converted to a frame period by the schema
+    cg.add(var.set_initial_period(config[CONF_FPS]))
 
+    # ESPHome drives to_code with its own scheduler rather than an asyncio loop,
+    # so these lookups can't be gathered; an await on an undeclared ID simply
+    # yields until it exists, so awaiting them in turn costs nothing extra.
     canvas_widget = await cg.get_variable(config[CONF_CANVAS])
-
+    initial_game_var = cg.nullptr
     if initial_game := config.get(CONF_INITIAL_GAME):
         initial_game_var = await cg.get_variable(initial_game)
 
     cg.add(
         var.setup_binding(
             canvas_widget,
-            initial_game_var if initial_game else None,
+            initial_game_var,
             config[CONF_START_PAUSED],
         )
     )
 
 
+# Every action targets a runner; the ones with extra options extend this schema.
+# Start/pause/resume/toggle take nothing else and share one codegen coroutine.
+_RUNNER_ID_SCHEMA = cv.Schema({cv.GenerateID(): cv.use_id(LvglGameRunner)})
+
+
 @automation.register_action(
     "lvgl_game_runner.start",
     StartAction,
-    cv.Schema({cv.GenerateID(): cv.use_id(LvglGameRunner)}),
+    _RUNNER_ID_SCHEMA,
 )
 @automation.register_action(
     "lvgl_game_runner.pause",
     PauseAction,
-    cv.Schema({cv.GenerateID(): cv.use_id(LvglGameRunner)}),
+    _RUNNER_ID_SCHEMA,
 )
 @automation.register_action(
     "lvgl_game_runner.resume",
     ResumeAction,
-    cv.Schema({cv.GenerateID(): cv.use_id(LvglGameRunner)}),
+    _RUNNER_ID_SCHEMA,
 )
 @automation.register_action(
     "lvgl_game_runner.toggle",
     ToggleAction,
-    cv.Schema({cv.GenerateID(): cv.use_id(LvglGameRunner)}),
+    _RUNNER_ID_SCHEMA,
 )
-async def toggle_to_code(config, action_id, template_arg, args):
+async def simple_action_to_code(config, action_id, template_arg, args):
     var = cg.new_Pvariable(action_id)
     await cg.register_parented(var, config[CONF_ID])
     return var
@@ -132,10 +181,11 @@ async def toggle_to_code(config, action_id, template_arg, args):
     "lvgl_game_runner.set_fps",
     SetFpsAction,
     cv.maybe_simple_value(
-        {
-            cv.GenerateID(): cv.use_id(LvglGameRunner),
-            cv.Required(CONF_FPS): cv.float_range(min=1.0, max=240.0),
-        },
+        _RUNNER_ID_SCHEMA.extend(
+            {
+                cv.Required(CONF_FPS): _FPS_VALIDATOR,
+            }
+        ),
         key=CONF_FPS,
     ),
 )
@@ -150,10 +200,11 @@ async def setfps_to_code(config, action_id, template_arg, args):
     "lvgl_game_runner.set_game",
     SetGameAction,
     cv.maybe_simple_value(
-        {
-            cv.GenerateID(): cv.use_id(LvglGameRunner),
-            cv.Required(CONF_GAME): cv.use_id(GameBase),
-        },
+        _RUNNER_ID_SCHEMA.extend(
+            {
+                cv.Required(CONF_GAME): cv.use_id(GameBase),
+            }
+        ),
         key=CONF_GAME,
     ),
 )
@@ -168,11 +219,10 @@ async def setgame_to_code(config, action_id, template_arg, args):
 @automation.register_action(
     "lvgl_game_runner.send_input",
     SendInputAction,
-    cv.Schema(
+    _RUNNER_ID_SCHEMA.extend(
         {
-            cv.GenerateID(): cv.use_id(LvglGameRunner),
-            cv.Required(CONF_INPUT): cv.templatable(cv.enum(INPUT_TYPES)),
-            cv.Optional(CONF_PLAYER, default=1): cv.templatable(cv.int_range(min=1, max=4)),
+            cv.Required(CONF_INPUT): _INPUT_TYPE_VALIDATOR,
+            cv.Optional(CONF_PLAYER, default=1): _PLAYER_VALIDATOR,
             cv.Required(CONF_PRESSED): cv.templatable(cv.boolean),
         }
     ),
@@ -181,12 +231,13 @@ async def setgame_to_code(config, action_id, template_arg, args):
     "lvgl_game_runner.press_input",
     SendInputAction,
     cv.maybe_simple_value(
-        {
-            cv.GenerateID(): cv.use_id(LvglGameRunner),
-            cv.Required(CONF_INPUT): cv.templatable(cv.enum(INPUT_TYPES)),
-            cv.Optional(CONF_PLAYER, default=1): cv.templatable(cv.int_range(min=1, max=4)),
-            cv.Optional(CONF_PRESSED, default=True): cv.templatable(cv.boolean),
-        },
+        _RUNNER_ID_SCHEMA.extend(
+            {
+                cv.Required(CONF_INPUT): _INPUT_TYPE_VALIDATOR,
+                cv.Optional(CONF_PLAYER, default=1): _PLAYER_VALIDATOR,
+                cv.Optional(CONF_PRESSED, default=True): cv.templatable(cv.boolean),
+            }
+        ),
         key=CONF_INPUT,
     ),
 )
@@ -194,12 +245,13 @@ async def setgame_to_code(config, action_id, template_arg, args):
     "lvgl_game_runner.release_input",
     SendInputAction,
     cv.maybe_simple_value(
-        {
-            cv.GenerateID(): cv.use_id(LvglGameRunner),
-            cv.Required(CONF_INPUT): cv.templatable(cv.enum(INPUT_TYPES)),
-            cv.Optional(CONF_PLAYER, default=1): cv.templatable(cv.int_range(min=1, max=4)),
-            cv.Optional(CONF_PRESSED, default=False): cv.templatable(cv.boolean),
-        },
+        _RUNNER_ID_SCHEMA.extend(
+            {
+                cv.Required(CONF_INPUT): _INPUT_TYPE_VALIDATOR,
+                cv.Optional(CONF_PLAYER, default=1): _PLAYER_VALIDATOR,
+                cv.Optional(CONF_PRESSED, default=False): cv.templatable(cv.boolean),
+            }
+        ),
         key=CONF_INPUT,
     ),
 )